@@ -97,4 +97,9 @@ def tax_rate_decimal_to_percent(value: str) -> str:
 
 MAX_WIX_IMAGE_BYTES = 25 * 1024 * 1024
 
+# Concurrent Drive downloads when push prefetches row images (see
+# images.prefetch_drive_images). Small on purpose: Drive's per-user quota is
+# shared with everything else the service account does.
+DRIVE_PREFETCH_WORKERS = 4
+
 
@@ -10,6 +10,7 @@ from typing import ClassVar, FrozenSet, List, Optional, Tuple
 
 from pydantic import (
     BaseModel,
+    ConfigDict,
     Field,
     ValidationError,
     field_validator,
@@ -30,6 +31,10 @@ VALID_CHECKOUT_FORMS = {CHECKOUT_FORM_PER_TICKET, CHECKOUT_FORM_PER_ORDER}
 
 
 class EventRecord(BaseModel):
+    # Build the validator on first use, not at import: validate, setup and
+    # the Notion-only commands import this module but never build a record.
+    model_config = ConfigDict(defer_build=True)
+
     name: str = Field(..., min_length=1)
     category: Optional[str] = None
     event_type: Optional[str] = None
@@ -89,6 +94,8 @@ class EventRecord(BaseModel):
     @field_validator("start_date", "end_date", mode="before")
     @classmethod
     def validate_dates(cls, value: str) -> str:
+        # Normalized once here: payload builders and diffs read the ISO
+        # value as-is instead of re-parsing it per call.
         if not isinstance(value, str) or not value.strip():
             raise ValueError("Date value is required")
         return convert_date_to_iso(value.strip())
@@ -8,7 +8,6 @@ CLI aliases until the Notion path is proven out.
 
 from __future__ import annotations
 
-import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Set
@@ -1334,7 +1333,8 @@ def enrich_events(
         classes_by_page_id = {
             c["page_id"]: c for c in classes.values() if c.get("page_id")
         }
-        settings = store.fetch_settings()
+        # Shared with the ticket accessors: one Settings read per run.
+        settings = runtime.get_settings()
 
         enriched = 0
         skipped = 0
@@ -1492,9 +1492,6 @@ def _converge_hosted_image(
         logger.warning("   ⚠️  Could not update row image URL: %s", exc)
 
 
-# Pacing between Wix mutations to stay friendly with rate limits.
-WIX_MUTATION_PACING_SECONDS = 1.0
-
 # Sync Error note when an event went live but its tickets could not be
 # created — without it the row lands on Published with nothing on sale and
 # no visible signal.
@@ -1528,12 +1525,6 @@ def _write_row_result(ctx: _SyncContext, page_id: str, **kwargs: Any) -> None:
         ctx.store.write_sync_result(page_id, **kwargs)
 
 
-def _pace_wix(ctx: _SyncContext) -> None:
-    """Pause after a Wix mutation (skipped on dry runs, which mutate nothing)."""
-    if not ctx.dry_run:
-        time.sleep(WIX_MUTATION_PACING_SECONDS)
-
-
 def _match_wix_event(
     row: Dict[str, Any],
     by_id: Dict[str, Dict[str, Any]],
@@ -1682,7 +1673,8 @@ def _get_defaults_context(ctx: _SyncContext) -> tuple:
         classes_by_page_id = {
             c["page_id"]: c for c in classes.values() if c.get("page_id")
         }
-        settings = ctx.store.fetch_settings()
+        # Same cached read the ticket policy/capacity accessors use.
+        settings = ctx.runtime.get_settings()
         ctx._defaults_context = (classes, classes_by_page_id, settings)
     return ctx._defaults_context
 
@@ -1757,7 +1749,6 @@ def _handle_cancel_row(
             ctx, page_id, status=STATUS_ERROR, wix_event_id=wix_id,
             error=f"Cancel failed: {exc}",
         )
-    _pace_wix(ctx)
 
 
 def _handle_delete_row(
@@ -1800,7 +1791,6 @@ def _handle_delete_row(
             ctx, page_id, status=STATUS_ERROR, wix_event_id=wix_id,
             error="Delete failed — see sync logs",
         )
-    _pace_wix(ctx)
 
 
 def _numbers_differ(row_value: Any, record_value: Any) -> bool:
@@ -2024,7 +2014,6 @@ def _push_update_row(
             ctx, page_id, status=STATUS_ERROR, wix_event_id=wix_id,
             error="Update failed — see sync logs",
         )
-    _pace_wix(ctx)
 
 
 def _push_matched_ready_row(
@@ -2072,7 +2061,6 @@ def _push_matched_ready_row(
                 if ctx.auto_create_tickets else None
             ),
         )
-        _pace_wix(ctx)
         return
 
     # Already exists (live, or draft while in --draft mode): update.
@@ -2132,7 +2120,6 @@ def _push_matched_ready_row(
             ctx, page_id, status=STATUS_ERROR, wix_event_id=wix_id,
             error="Update failed — see sync logs",
         )
-    _pace_wix(ctx)
 
 
 def _create_new_event(
@@ -2190,7 +2177,6 @@ def _create_new_event(
             ctx, page_id, status=STATUS_ERROR,
             error="Create failed — see sync logs",
         )
-    _pace_wix(ctx)
 
 
 def _refresh_row(ctx: _SyncContext, row: Dict[str, Any], name: str) -> None:
@@ -2347,6 +2333,25 @@ def _log_sync_summary(
     )
 
 
+def _prefetch_row_images(runtime: SyncRuntime, rows: List[Dict[str, Any]]) -> None:
+    """Warm the Drive cache for rows whose push will upload an image.
+
+    Purely an optimization: any failure here leaves the per-row download
+    path to fetch (and report) the image as before.
+    """
+    from .images import prefetch_drive_images
+
+    urls = [
+        (row.get("image_url") or "").strip()
+        for row in rows
+        if (row.get("status") or "") in (STATUS_READY, STATUS_UPDATE)
+    ]
+    try:
+        prefetch_drive_images(urls, runtime)
+    except Exception as exc:
+        logger.warning("⚠️  Image prefetch skipped: %s", exc)
+
+
 def _run_status_loop(
     runtime: SyncRuntime,
     statuses: List[str],
@@ -2356,13 +2361,16 @@ def _run_status_loop(
     dry_run: bool = False,
     draft: bool = False,
     auto_create_tickets: bool = True,
+    prefetch_images: bool = False,
 ) -> Optional[Dict[str, List[str]]]:
     """Shared fetch/index/dispatch loop behind the sync and push flows.
 
     Fetches Notion rows in ``statuses``, indexes the live Wix events, and
     runs ``handler(ctx, row, name)`` on each row. Returns the results dict
     for ``_log_sync_summary``, or ``None`` when there were no rows to
-    process (``empty_message`` is logged instead).
+    process (``empty_message`` is logged instead). ``prefetch_images``
+    downloads the Ready/Update rows' Drive images concurrently up front;
+    the rows themselves are still handled one at a time.
     """
     store: NotionStore = runtime.get_notion_store()
     rows = store.fetch_event_rows(statuses=statuses)
@@ -2404,6 +2412,9 @@ def _run_status_loop(
         auto_create_tickets=auto_create_tickets,
     )
 
+    if prefetch_images:
+        _prefetch_row_images(runtime, rows)
+
     for row in rows:
         name = row.get("event_name") or "(unnamed)"
         try:
@@ -2547,6 +2558,7 @@ def notion_push_events(
             dry_run=dry_run,
             draft=draft,
             auto_create_tickets=auto_create_tickets,
+            prefetch_images=not dry_run,
         )
         if results is None:
             return True
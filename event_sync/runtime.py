@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any, Dict, Optional, Tuple
 
 from .config import AppConfig, ConfigError
@@ -28,6 +27,7 @@ class SyncRuntime:
         self.config = config
         self._wix_client: Optional[WixClient] = None
         self._drive_service = None
+        self._drive_credentials = None
         self._notion_store = None
         self._credentials_info: Optional[Dict[str, Any]] = None
         self._drive_download_cache: Dict[str, CacheEntry] = {}
@@ -39,6 +39,8 @@ class SyncRuntime:
         # was created (event live, nothing on sale); sync surfaces it as a
         # Sync Error note on the row.
         self.last_ticket_failure: Optional[str] = None
+        # Settings DB rows, shared by the accessors below (None = not fetched yet).
+        self._settings: Optional[Dict[str, str]] = None
         # Lazily-resolved global ticket policy blurb (None = not fetched yet).
         self._ticket_policy_text: Optional[str] = None
         # Lazily-resolved fallback ticket inventory (None = not fetched yet).
@@ -55,10 +57,12 @@ class SyncRuntime:
     # -------------------------
     def _load_credentials_info(self) -> Dict[str, Any]:
         if self._credentials_info is None:
-            creds_json = self.config.google_credentials
-            if not creds_json:
+            # AppConfig parses GOOGLE_CREDENTIALS once and caches the dict;
+            # google-auth only reads it, so no defensive copy is needed.
+            creds_info = self.config.google_credentials
+            if not creds_info:
                 raise ConfigError("GOOGLE_CREDENTIALS is missing or invalid")
-            self._credentials_info = json.loads(json.dumps(creds_json))
+            self._credentials_info = creds_info
         return self._credentials_info
 
     def get_wix_client(self) -> WixClient:
@@ -77,15 +81,42 @@ class SyncRuntime:
         its ~1s import cost (or need it installed at all).
         """
         if self._drive_service is None:
+            self._drive_service = self.build_drive_service()
+        return self._drive_service
+
+    def get_drive_credentials(self):
+        """Service-account credentials shared by every Drive client.
+
+        Built and refreshed once, so all clients reuse one access token
+        instead of each signing a JWT and exchanging it. Call this on the
+        main thread before fanning out; google-auth refreshes the token
+        again only when it expires.
+        """
+        if self._drive_credentials is None:
+            from google.auth.transport.requests import Request
             from google.oauth2 import service_account
-            from googleapiclient.discovery import build
 
             creds_dict = self._load_credentials_info()
             credentials = service_account.Credentials.from_service_account_info(
                 creds_dict, scopes=[self.DRIVE_SCOPE]
             )
-            self._drive_service = build("drive", "v3", credentials=credentials)
-        return self._drive_service
+            credentials.refresh(Request())
+            self._drive_credentials = credentials
+        return self._drive_credentials
+
+    def build_drive_service(self):
+        """A new Drive client on its own HTTP transport.
+
+        The transport (httplib2) is not thread-safe, so each prefetch worker
+        builds its own; the credentials are shared. Everything else uses
+        ``get_drive_service``.
+        """
+        from googleapiclient.discovery import build
+
+        credentials = self.get_drive_credentials()
+        # The discovery doc ships with the SDK; the legacy file cache only
+        # logs an oauth2client warning and probes the filesystem per build.
+        return build("drive", "v3", credentials=credentials, cache_discovery=False)
 
     def get_notion_store(self):
         if self._notion_store is None:
@@ -96,6 +127,17 @@ class SyncRuntime:
             self._notion_store = NotionStore(self.config)
         return self._notion_store
 
+    def get_settings(self) -> Dict[str, str]:
+        """Settings DB rows, queried at most once per run.
+
+        The ticket policy and default capacity live in the same database, so
+        both accessors share this read. A failed read is not cached; each
+        accessor applies its own fallback.
+        """
+        if self._settings is None:
+            self._settings = self.get_notion_store().fetch_settings()
+        return self._settings
+
     def get_ticket_policy_text(self) -> str:
         """Global policy blurb attached to every ticket the pipeline creates.
 
@@ -108,7 +150,7 @@ class SyncRuntime:
         if self._ticket_policy_text is None:
             text = ""
             try:
-                settings = self.get_notion_store().fetch_settings()
+                settings = self.get_settings()
                 text = (settings.get("default_ticket_policy") or "").strip()
             except Exception as exc:
                 logger.warning(
@@ -137,7 +179,7 @@ class SyncRuntime:
         if self._default_ticket_capacity is None:
             capacity = DEFAULT_CAPACITY
             try:
-                settings = self.get_notion_store().fetch_settings()
+                settings = self.get_settings()
                 capacity = int(float(settings.get("default_capacity", "")))
             except Exception:
                 capacity = DEFAULT_CAPACITY
@@ -43,12 +43,18 @@ def convert_date_to_iso(date_str: str) -> str:
     )
 
 
+_DRIVE_FILE_ID_PATTERNS = (
+    re.compile(r"/file/d/([a-zA-Z0-9_-]+)"),
+    re.compile(r"id=([a-zA-Z0-9_-]+)"),
+    re.compile(r"^([a-zA-Z0-9_-]+)$"),
+)
+
+
 def extract_google_drive_file_id(url: str) -> str | None:
     """Extract Google Drive file id from URL or raw id if present."""
 
-    patterns = [r"/file/d/([a-zA-Z0-9_-]+)", r"id=([a-zA-Z0-9_-]+)", r"^([a-zA-Z0-9_-]+)$"]
-    for pattern in patterns:
-        match = re.search(pattern, url)
+    for pattern in _DRIVE_FILE_ID_PATTERNS:
+        match = pattern.search(url)
         if match:
             return match.group(1)
     return None
@@ -6,6 +6,7 @@ Reusable client for interacting with Wix Events and related APIs
 
 import logging
 import os
+import threading
 import time
 from copy import deepcopy
 from itertools import islice
@@ -13,6 +14,7 @@ from typing import Any, Dict, Iterator, List, Optional
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
 load_dotenv()
 
@@ -23,6 +25,60 @@ class WixApiError(Exception):
     """Raised when a Wix API operation fails."""
 
 
+# Write pacing: a burst of mutations goes out immediately, sustained
+# traffic is held to the refill rate. Replaces the flat per-row sleep —
+# small pushes no longer wait at all, big ones stay under Wix's quota.
+WRITE_BURST = 10
+WRITE_RATE_PER_SECOND = 2.0
+
+# Keep-alive pool sizing. pool_maxsize bounds concurrent sockets per host
+# (www.wixapis.com plus the media upload host), so parallel callers reuse
+# connections instead of discarding them when the pool is full.
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+# Upper bound on a server-provided Retry-After, so a bogus header can't
+# stall a run.
+MAX_RETRY_AFTER_SECONDS = 60
+
+# Largest page the v3 query endpoints accept. Capped limit-style helpers
+# page at min(limit, this) and stop as soon as they have enough items.
+MAX_QUERY_PAGE_SIZE = 100
+
+# URL imports finish asynchronously; how long import_file_from_url waits for
+# the file to leave PENDING before giving up (callers then fall back to
+# download + upload), and how often it re-checks. Push handles rows one at a
+# time, so the wait stays short: a slow import must not cost more than the
+# local path it replaces.
+IMPORT_READY_TIMEOUT_SECONDS = 5
+IMPORT_POLL_INTERVAL_SECONDS = 0.5
+
+
+class TokenBucket:
+    """Thread-safe token bucket; ``acquire()`` sleeps only when it runs dry."""
+
+    def __init__(self, capacity: int, rate_per_second: float):
+        self.capacity = float(capacity)
+        self.rate = rate_per_second
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, waiting for a refill if needed. Returns the wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
 class WixClient:
     """Client for Wix API operations"""
 
@@ -47,6 +103,19 @@ class WixClient:
         # Keep-alive connection pool: a sync makes dozens of calls to the
         # same host, and a fresh TLS handshake per call adds real seconds.
         self._session = requests.Session()
+        # Retries stay in _request, which knows which POSTs are safe to
+        # repeat; the adapter itself must never retry on its own.
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=0,
+        )
+        self._session.mount('https://', adapter)
+        self._write_limiter = TokenBucket(WRITE_BURST, WRITE_RATE_PER_SECOND)
+        # Credentials are fixed for the client's lifetime, so every API call
+        # can share one headers dict. Kept off session.headers on purpose:
+        # the signed upload PUT must not carry the API key.
+        self._default_headers = self._headers()
 
         logger.info(
             "Wix Client initialized for site %s…", (self.site_id or "")[:8]
@@ -60,7 +129,6 @@ class WixClient:
             'Content-Type': content_type
         }
 
-
         # Add account ID if available (required for some APIs like Site Media)
         if self.account_id:
             headers['wix-account-id'] = self.account_id
@@ -79,18 +147,41 @@ class WixClient:
             return True
         return method.upper() == 'POST' and endpoint.rstrip('/').endswith('/query')
 
+    @staticmethod
+    def _is_write(method: str, endpoint: str) -> bool:
+        """Whether a call mutates Wix state (and so counts against pacing)."""
+        if method.upper() == 'GET':
+            return False
+        return not (
+            method.upper() == 'POST' and endpoint.rstrip('/').endswith('/query')
+        )
+
+    @staticmethod
+    def _retry_after(response: Optional[requests.Response], fallback: float) -> float:
+        """Seconds to wait before retrying a 429, honoring ``Retry-After``."""
+        headers = getattr(response, 'headers', None) or {}
+        value = headers.get('Retry-After')
+        try:
+            seconds = float(value)
+        except (TypeError, ValueError):
+            return fallback
+        return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+
     def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Make a request to Wix API with retry logic and error handling"""
         url = f"{self.base_url}{endpoint}"
         max_retries = 3
         timeout = kwargs.pop('timeout', 30)  # Default 30 second timeout
+        is_write = self._is_write(method, endpoint)
 
         for attempt in range(max_retries):
+            if is_write:
+                self._write_limiter.acquire()
             try:
                 response = self._session.request(
                     method,
                     url,
-                    headers=self._headers(),
+                    headers=self._default_headers,
                     timeout=timeout,
                     **kwargs
                 )
@@ -102,8 +193,9 @@ class WixClient:
                 # Rate limiting (429): safe to retry anything — the request
                 # was rejected before processing.
                 if status == 429 and attempt < max_retries - 1:
-                    wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
-                    logger.warning("Rate limited. Retrying in %ds... (attempt %d/%d)", wait_time, attempt + 1, max_retries)
+                    # Server hint first, else exponential backoff: 1s, 2s, 4s
+                    wait_time = self._retry_after(e.response, 2 ** attempt)
+                    logger.warning("Rate limited. Retrying in %gs... (attempt %d/%d)", wait_time, attempt + 1, max_retries)
                     time.sleep(wait_time)
                     continue
                 # Transient gateway errors: retry only idempotent calls.
@@ -186,7 +278,7 @@ class WixClient:
 
             response = self._request('POST', endpoint, json=body)
             payload = response.json() or {}
-            items = payload.get(array_key, []) or []
+            items = payload.get(array_key) or ()
 
             for item in items:
                 yield item
@@ -210,7 +302,7 @@ class WixClient:
         """Return up to ``limit`` events starting at ``offset``."""
 
         iterator = self.iter_events(
-            page_size=max(limit, 1),
+            page_size=min(max(limit, 1), MAX_QUERY_PAGE_SIZE),
             include_drafts=include_drafts,
             status_filter=status_filter,
             offset=offset,
@@ -344,7 +436,9 @@ class WixClient:
     def get_orders(self, event_id: str = None, limit: int = 50) -> List[Dict[str, Any]]:
         """Return up to ``limit`` ticket orders."""
 
-        iterator = self.iter_orders(event_id=event_id, page_size=max(limit, 1))
+        iterator = self.iter_orders(
+            event_id=event_id, page_size=min(max(limit, 1), MAX_QUERY_PAGE_SIZE)
+        )
         return list(islice(iterator, limit))
 
     def iter_orders(
@@ -399,6 +493,52 @@ class WixClient:
         # Fallback (shouldn't happen)
         raise WixApiError("Upload succeeded but no file descriptor returned")
 
+    def import_file_from_url(
+        self,
+        url: str,
+        display_name: Optional[str] = None,
+        timeout: float = IMPORT_READY_TIMEOUT_SECONDS,
+    ) -> Dict[str, Any]:
+        """Have Wix fetch a public image URL server-side; return the READY descriptor.
+
+        Saves the download + re-upload hop through this machine. The import
+        is asynchronous — acceptance only means Wix queued it (``PENDING``);
+        an unreachable URL, a non-image or an oversized file surfaces later
+        as ``FAILED``. So this polls the file until it is ``READY`` and
+        raises ``WixApiError`` on ``FAILED`` or when ``timeout`` runs out.
+
+        A timed-out import is abandoned, not cancelled: Wix may still finish
+        it later, leaving an unreferenced copy in Media Manager next to the
+        file the caller's fallback uploads.
+        """
+        body: Dict[str, Any] = {'url': url, 'mediaType': 'IMAGE'}
+        if display_name:
+            body['displayName'] = display_name
+        response = self._request('POST', '/site-media/v1/files/import', json=body)
+        file_descriptor = response.json().get('file')
+        if not file_descriptor or not file_descriptor.get('id'):
+            raise WixApiError("Import accepted but no file descriptor returned")
+
+        deadline = time.monotonic() + timeout
+        while True:
+            status = file_descriptor.get('operationStatus') or 'READY'
+            if status == 'READY':
+                return file_descriptor
+            if status == 'FAILED':
+                raise WixApiError(f"Wix could not import {url}")
+            if time.monotonic() >= deadline:
+                raise WixApiError(f"Import of {url} still {status} after {timeout:g}s")
+            time.sleep(IMPORT_POLL_INTERVAL_SECONDS)
+            file_descriptor = self.get_file(file_descriptor['id'])
+
+    def get_file(self, file_id: str) -> Dict[str, Any]:
+        """Return a Media Manager file descriptor (includes ``operationStatus``)."""
+        response = self._request('GET', f'/site-media/v1/files/{file_id}')
+        file_descriptor = response.json().get('file')
+        if not file_descriptor:
+            raise WixApiError(f"No file descriptor returned for {file_id}")
+        return file_descriptor
+
     def create_ticket_definition(
         self,
         event_id: str,
@@ -599,7 +739,7 @@ class WixClient:
 
             response = self._request('POST', endpoint, json={'query': query})
             payload = response.json() or {}
-            items = payload.get(array_key, []) or []
+            items = payload.get(array_key) or ()
 
             for item in items:
                 yield item
@@ -719,15 +859,16 @@ class WixClient:
 
     # Utility Methods
 
+    def _iter_events_matching_title(self, title: str) -> Iterator[Dict[str, Any]]:
+        query = title.lower()
+        for event in self.iter_events(page_size=100):
+            if query in (event.get('title') or '').lower():
+                yield event
+
     def search_events_by_title(self, title: str) -> List[Dict[str, Any]]:
         """Search for events by title"""
-        return [
-            event
-            for event in self.iter_events(page_size=100)
-            if title.lower() in event.get('title', '').lower()
-        ]
+        return list(self._iter_events_matching_title(title))
 
     def get_event_by_title(self, title: str) -> Optional[Dict[str, Any]]:
-        """Get the first event matching a title"""
-        results = self.search_events_by_title(title)
-        return results[0] if results else None
+        """Get the first event matching a title (stops paging at the first hit)"""
+        return next(self._iter_events_matching_title(title), None)
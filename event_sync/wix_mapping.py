@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import re
 from datetime import datetime, timezone
+from functools import lru_cache
 from html import escape
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
@@ -37,7 +38,6 @@ from .models import (
     CHECKOUT_FORM_PER_TICKET,
     EventRecord,
 )
-from .utils import convert_date_to_iso
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
     from .runtime import SyncRuntime
@@ -55,8 +55,14 @@ CURRENT_WIX_EVENT_STATUSES = frozenset({"UPCOMING", "STARTED"})
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=1024)
 def wix_timestamp(date_iso: str, time_24h: str, tz_name: str) -> str:
-    """Return a UTC timestamp string for Wix while respecting the site timezone."""
+    """Return a UTC timestamp string for Wix while respecting the site timezone.
+
+    Memoized: the payload builder and the update diff convert the same
+    row's date/time pair, and a pure function of three strings is safe to
+    cache.
+    """
 
     naive = datetime.strptime(f"{date_iso} {time_24h}", "%Y-%m-%d %H:%M")
 
@@ -321,6 +327,9 @@ SAFE_HTML_TAGS = frozenset({
 _TAG_RE = re.compile(r'(<[^>]+>)')
 _TAG_NAME_RE = re.compile(r'^</?([a-zA-Z][a-zA-Z0-9]*)')
 _BLOCK_TAG_RE = re.compile(r'<(?:p|div|ul|ol|h[1-6]|blockquote)[\s>/]', re.IGNORECASE)
+_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_ITALIC_RE = re.compile(r'\*(.+?)\*')
 
 
 def _escape_preserving_html(text: str) -> str:
@@ -363,13 +372,9 @@ def _inline_markdown(text: str) -> str:
 
     Supported: **bold**, *italic*, [text](url)
     """
-    text = re.sub(
-        r'\[([^\]]+)\]\(([^)]+)\)',
-        r'<a href="\2" target="_blank">\1</a>',
-        text,
-    )
-    text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text)
-    text = re.sub(r'\*(.+?)\*', r'<i>\1</i>', text)
+    text = _LINK_RE.sub(r'<a href="\2" target="_blank">\1</a>', text)
+    text = _BOLD_RE.sub(r'<b>\1</b>', text)
+    text = _ITALIC_RE.sub(r'<i>\1</i>', text)
     return text
 
 
@@ -454,22 +459,23 @@ def build_wix_event_payload(
     file_descriptor: Optional[Dict[str, Any]] = None,
     existing_event: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    start_date_iso = convert_date_to_iso(event.start_date)
-    end_date_iso = convert_date_to_iso(event.end_date)
+    # EventRecord's validators already normalized the dates to ISO.
+    start_date_iso = event.start_date
+    end_date_iso = event.end_date
 
     title = event.name.strip()
+    tz_name = runtime.config.timezone
 
+    # One literal per call: the interpreter builds the nested shape directly,
+    # which beats deep-copying a shared template (and can't leak mutations
+    # between events the way a reused template could).
     event_data: Dict[str, Any] = {
         "title": title,
         "dateAndTimeSettings": {
             "dateAndTimeTbd": False,
-            "startDate": wix_timestamp(
-                start_date_iso, event.start_time, runtime.config.timezone
-            ),
-            "endDate": wix_timestamp(
-                end_date_iso, event.end_time, runtime.config.timezone
-            ),
-            "timeZoneId": runtime.config.timezone,
+            "startDate": wix_timestamp(start_date_iso, event.start_time, tz_name),
+            "endDate": wix_timestamp(end_date_iso, event.end_time, tz_name),
+            "timeZoneId": tz_name,
         },
         "location": {
             "type": "VENUE",
@@ -557,14 +563,10 @@ def diff_event_fields(
         diffs.append(("title", expected_title, actual_title))
 
     expected_start = wix_timestamp(
-        convert_date_to_iso(event.start_date),
-        event.start_time,
-        runtime.config.timezone,
+        event.start_date, event.start_time, runtime.config.timezone,
     )
     expected_end = wix_timestamp(
-        convert_date_to_iso(event.end_date),
-        event.end_time,
-        runtime.config.timezone,
+        event.end_date, event.end_time, runtime.config.timezone,
     )
 
     date_settings = existing_event.get("dateAndTimeSettings") or {}
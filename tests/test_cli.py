@@ -8,7 +8,7 @@ from event_sync import cli
 
 
 @pytest.fixture
-def clear_env(monkeypatch):
+def clear_env():
     keys = [
         "WIX_API_KEY",
         "WIX_ACCOUNT_ID",
@@ -24,15 +24,14 @@ def clear_env(monkeypatch):
         "NOTION_SETTINGS_DB_ID",
         "NOTION_SITE_CONFIG_DB_ID",
     ]
-    originals = {key: os.getenv(key) for key in keys}
+    # One snapshot restores everything, including anything a test (or a
+    # .env load inside cli.main) set that isn't in ``keys``.
+    snapshot = os.environ.copy()
     for key in keys:
-        monkeypatch.delenv(key, raising=False)
+        os.environ.pop(key, None)
     yield
-    for key, value in originals.items():
-        if value is None:
-            monkeypatch.delenv(key, raising=False)
-        else:
-            monkeypatch.setenv(key, value)
+    os.environ.clear()
+    os.environ.update(snapshot)
 
 
 def test_cli_validate_fails_when_env_missing(clear_env):
@@ -560,6 +560,7 @@ class TestEnrichNameFill:
         )
         runtime = SimpleNamespace(
             get_notion_store=lambda: store,
+            get_settings=lambda: store.fetch_settings(),
             config=SimpleNamespace(timezone="America/Toronto"),
         )
         assert enrich_events(runtime) is True
@@ -92,3 +92,9 @@ def test_wix_timestamp_converts_to_utc_with_timezone():
 
     assert timestamp == "2025-12-25T12:00:00Z"
 
+
+def test_bare_bullet_marker_lines_render_as_paragraph_text():
+    # A marker with nothing after it is not a list item; pinned so
+    # Published rows never pick up phantom description diffs.
+    assert format_description_as_html("a\n- \nb") == "<p>a</p><p>-</p><p>b</p>"
+    assert format_description_as_html("- x\n-  \n- y") == "<p>- x<br/>-<br/>- y</p>"
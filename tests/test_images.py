@@ -1,13 +1,18 @@
 """Tests for image processing utilities."""
 
+from functools import lru_cache
 from io import BytesIO
 
 from PIL import Image
 
 import event_sync.images as images
+from event_sync.config import AppConfig
+from event_sync.runtime import SyncRuntime
 
 
+@lru_cache(maxsize=8)
 def _generate_image_bytes(size=(200, 200), color=(255, 0, 0)) -> bytes:
+    """JPEG payload, encoded once per (size, color) for the whole module."""
     image = Image.new("RGB", size, color=color)
     buffer = BytesIO()
     image.save(buffer, format="JPEG", quality=95)
@@ -40,3 +45,322 @@ def test_prepare_image_compresses_when_overridden_limit(monkeypatch):
     assert resized is True
 
 
+def test_prepare_image_recompresses_as_progressive_jpeg(monkeypatch):
+    img_bytes = _generate_image_bytes(size=(800, 800))
+    monkeypatch.setattr(images, "MAX_WIX_IMAGE_BYTES", len(img_bytes) // 4)
+
+    processed, _, _, resized = images.prepare_image_for_wix(
+        img_bytes, "large.png", "image/png"
+    )
+
+    assert resized is True
+    assert Image.open(BytesIO(processed)).info.get("progressive")
+
+
+def test_encode_jpeg_keeps_optimize_when_progressive_is_rejected():
+    saves = []
+
+    class PickyImage:
+        def save(self, buffer, **kwargs):
+            saves.append(kwargs)
+            if kwargs.get("progressive"):
+                raise OSError("encoder rejected progressive")
+            buffer.write(b"jpeg")
+
+    assert images._encode_jpeg(PickyImage(), 80) == b"jpeg"
+    assert saves[-1] == {"format": "JPEG", "quality": 80, "optimize": True}
+    assert len(saves) == 2
+
+
+class FakeJson:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+class ImportingClient:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.imports = []
+        self.uploads = []
+
+    def import_file_from_url(self, url, display_name=None):
+        self.imports.append((url, display_name))
+        if self.fail:
+            raise RuntimeError("import rejected")
+        return {"id": "imported.jpg"}
+
+    def upload_image(self, image_data, filename, mime_type):
+        self.uploads.append(filename)
+        return {"id": "uploaded.jpg"}
+
+
+def make_runtime(client) -> SyncRuntime:
+    runtime = SyncRuntime(
+        AppConfig(
+            wix_api_key="k",
+            wix_account_id=None,
+            wix_site_id="s",
+            google_credentials_raw=None,
+        )
+    )
+    runtime._wix_client = client
+    return runtime
+
+
+def test_plain_url_is_imported_server_side_without_download(monkeypatch):
+    client = ImportingClient()
+    runtime = make_runtime(client)
+
+    def no_download(url):
+        raise AssertionError("imported URLs must not be downloaded locally")
+
+    monkeypatch.setattr(images, "download_from_http", no_download)
+
+    descriptor = images.upload_image_to_wix("https://example.com/poster.jpg?v=2", "Gala", runtime)
+
+    assert descriptor == {"id": "imported.jpg"}
+    assert client.imports == [("https://example.com/poster.jpg?v=2", "poster.jpg")]
+    assert client.uploads == []
+    assert runtime.get_cached_wix_media("https://example.com/poster.jpg?v=2") == descriptor
+
+
+def test_failed_url_import_falls_back_to_download_and_upload(monkeypatch):
+    client = ImportingClient(fail=True)
+    runtime = make_runtime(client)
+    monkeypatch.setattr(
+        images, "download_from_http", lambda url: (_generate_image_bytes(), "poster.jpg", "image/jpeg")
+    )
+
+    descriptor = images.upload_image_to_wix("https://example.com/poster.jpg", "Gala", runtime)
+
+    assert descriptor == {"id": "uploaded.jpg"}
+    assert len(client.imports) == 1
+    assert client.uploads == ["poster.jpg"]
+
+
+def test_drive_links_never_attempt_url_import(monkeypatch):
+    client = ImportingClient()
+    runtime = make_runtime(client)
+    monkeypatch.setattr(
+        images,
+        "download_from_google_drive",
+        lambda file_id, rt: (_generate_image_bytes(), "drive.jpg", "image/jpeg"),
+    )
+
+    descriptor = images.upload_image_to_wix(
+        "https://drive.google.com/file/d/abc123/view", "Gala", runtime
+    )
+
+    assert descriptor == {"id": "uploaded.jpg"}
+    assert client.imports == []
+
+
+def test_drive_download_returns_media_bytes_and_caches(monkeypatch):
+    payload = _generate_image_bytes()
+    calls = []
+
+    class Request:
+        def __init__(self, result):
+            self.result = result
+
+        def execute(self):
+            calls.append(1)
+            return self.result
+
+    class Files:
+        def get(self, fileId, fields):
+            return Request({"name": "poster.jpg", "mimeType": "image/jpeg"})
+
+        def get_media(self, fileId):
+            return Request(payload)
+
+    runtime = make_runtime(ImportingClient())
+    runtime._drive_service = type("Drive", (), {"files": lambda self: Files()})()
+
+    first = images.download_from_google_drive("abc123", runtime)
+    second = images.download_from_google_drive("abc123", runtime)
+
+    assert first == (payload, "poster.jpg", "image/jpeg")
+    assert second == first
+    assert len(calls) == 2  # metadata + media, once
+    assert runtime.cache_stats["drive_hits"] == 1
+
+
+def test_prefetch_downloads_unique_drive_images_into_cache(monkeypatch):
+    runtime = make_runtime(ImportingClient())
+    runtime._drive_credentials = object()
+    runtime.build_drive_service = lambda: object()
+    fetched = []
+
+    def fake_fetch(drive_service, file_id):
+        fetched.append(file_id)
+        if file_id == "broken":
+            raise RuntimeError("404")
+        return b"img-" + file_id.encode(), f"{file_id}.jpg", "image/jpeg"
+
+    monkeypatch.setattr(images, "_fetch_drive_file", fake_fetch)
+
+    count = images.prefetch_drive_images(
+        [
+            "https://drive.google.com/file/d/aaa/view",
+            "https://drive.google.com/open?id=aaa",
+            "bbb",
+            "broken",
+            "https://example.com/poster.jpg",
+            "",
+        ],
+        runtime,
+    )
+
+    assert count == 2
+    assert sorted(fetched) == ["aaa", "bbb", "broken"]
+    assert runtime.get_cached_drive_file("aaa") == (b"img-aaa", "aaa.jpg", "image/jpeg")
+    # Failures stay uncached so the per-row path retries and reports them.
+    assert runtime.get_cached_drive_file("broken") is None
+    assert runtime.cache_stats["drive_misses"] == 2
+
+
+def test_prefetch_workers_share_one_set_of_drive_credentials(monkeypatch):
+    from google.oauth2 import service_account
+    from googleapiclient import discovery
+
+    runtime = make_runtime(ImportingClient())
+    runtime._credentials_info = {"client_email": "svc@example.com"}
+    created, refreshed, built = [], [], []
+
+    class FakeCredentials:
+        def refresh(self, request):
+            refreshed.append(request)
+
+    def fake_from_info(info, scopes):
+        created.append(info)
+        return FakeCredentials()
+
+    def fake_build(service, version, credentials, cache_discovery):
+        built.append(credentials)
+        return object()
+
+    monkeypatch.setattr(
+        service_account.Credentials, "from_service_account_info", fake_from_info
+    )
+    monkeypatch.setattr(discovery, "build", fake_build)
+    monkeypatch.setattr(
+        images, "_fetch_drive_file",
+        lambda drive, file_id: (file_id.encode(), None, None),
+    )
+
+    count = images.prefetch_drive_images(["aaa", "bbb", "ccc", "ddd", "eee"], runtime)
+
+    assert count == 5
+    # One JWT sign + token exchange; each worker only builds its transport.
+    assert len(created) == 1
+    assert len(refreshed) == 1
+    assert built and all(c is built[0] for c in built)
+
+
+def test_prefetch_skips_the_pool_for_a_single_image(monkeypatch):
+    runtime = make_runtime(ImportingClient())
+
+    def no_fetch(drive_service, file_id):
+        raise AssertionError("a lone image is left to the per-row path")
+
+    monkeypatch.setattr(images, "_fetch_drive_file", no_fetch)
+
+    assert images.prefetch_drive_images(["aaa", "aaa"], runtime) == 0
+
+
+def test_prepare_image_picks_highest_fitting_quality_in_few_encodes(monkeypatch):
+    img_bytes = _generate_image_bytes(size=(400, 400))
+    real_encode = images._encode_jpeg
+    encoded = []
+
+    def sized_encode(image, quality):
+        encoded.append(quality)
+        # Sizes rise with quality; only q<=75 fits a 75-byte budget.
+        return real_encode(image, quality)[:quality]
+
+    monkeypatch.setattr(images, "_encode_jpeg", sized_encode)
+    monkeypatch.setattr(images, "MAX_WIX_IMAGE_BYTES", 75)
+
+    processed, _, _, resized = images.prepare_image_for_wix(
+        img_bytes, "big.jpg", "image/jpeg"
+    )
+
+    assert resized is True
+    assert len(processed) == 75
+    # q90 is tried first (too big), then the lower qualities are searched.
+    assert encoded == [90, 70, 80, 75]
+
+
+def test_prepare_image_encodes_once_when_top_quality_fits(monkeypatch):
+    img_bytes = _generate_image_bytes(size=(400, 400))
+    monkeypatch.setattr(images, "MAX_WIX_IMAGE_BYTES", len(img_bytes) - 1)
+    real_encode = images._encode_jpeg
+    encoded = []
+
+    def tiny_encode(image, quality):
+        encoded.append(quality)
+        return real_encode(image, quality)[:10]
+
+    monkeypatch.setattr(images, "_encode_jpeg", tiny_encode)
+
+    processed, _, _, resized = images.prepare_image_for_wix(
+        img_bytes, "big.png", "image/png"
+    )
+
+    assert resized is True
+    assert len(processed) == 10
+    assert encoded == [90]
+
+
+def test_url_import_that_ends_failed_falls_back_and_caches_the_upload(monkeypatch):
+    from event_sync import wix_client as wix_client_module
+    from event_sync.wix_client import WixClient
+
+    client = WixClient(api_key="k", site_id="s")
+    monkeypatch.setattr(wix_client_module.time, "sleep", lambda s: None)
+    replies = [
+        {"file": {"id": "pending.jpg", "operationStatus": "PENDING"}},
+        {"file": {"id": "pending.jpg", "operationStatus": "FAILED"}},
+    ]
+    monkeypatch.setattr(
+        client, "_request", lambda method, endpoint, **kw: FakeJson(replies.pop(0))
+    )
+    uploads = []
+    monkeypatch.setattr(
+        client,
+        "upload_image",
+        lambda data, filename, mime: uploads.append(filename) or {"id": "uploaded.jpg"},
+    )
+    monkeypatch.setattr(
+        images, "download_from_http", lambda url: (_generate_image_bytes(), "poster.jpg", "image/jpeg")
+    )
+    runtime = make_runtime(client)
+
+    descriptor = images.upload_image_to_wix("https://example.com/poster.jpg", "Gala", runtime)
+
+    assert descriptor == {"id": "uploaded.jpg"}
+    assert uploads == ["poster.jpg"]
+    assert replies == []
+    assert runtime.get_cached_wix_media("https://example.com/poster.jpg") == {"id": "uploaded.jpg"}
+
+
+def test_non_ready_import_descriptor_is_never_cached(monkeypatch):
+    class PendingClient(ImportingClient):
+        def import_file_from_url(self, url, display_name=None):
+            self.imports.append((url, display_name))
+            return {"id": "pending.jpg", "operationStatus": "PENDING"}
+
+    client = PendingClient()
+    runtime = make_runtime(client)
+    monkeypatch.setattr(
+        images, "download_from_http", lambda url: (_generate_image_bytes(), "poster.jpg", "image/jpeg")
+    )
+
+    descriptor = images.upload_image_to_wix("https://example.com/poster.jpg", "Gala", runtime)
+
+    assert descriptor == {"id": "uploaded.jpg"}
+    assert client.uploads == ["poster.jpg"]
@@ -295,6 +295,7 @@ def make_runtime(store, client) -> SimpleNamespace:
             "drive_hits": 0, "drive_misses": 0, "wix_hits": 0, "wix_uploads": 0,
         },
         get_notion_store=lambda: store,
+        get_settings=lambda: store.fetch_settings(),
         get_wix_client=lambda: client,
         get_ticket_policy_text=lambda: "",
         get_default_ticket_capacity=lambda: 24,
@@ -307,7 +308,6 @@ def patch_sync(monkeypatch, config_row, wix_event):
         "index_events_by_id_and_key",
         lambda runtime, fieldsets=None: ({wix_event["id"]: wix_event}, {}),
     )
-    monkeypatch.setattr(notion_orchestrator.time, "sleep", lambda s: None)
     monkeypatch.setattr(
         notion_orchestrator,
         "wix_event_to_config_row",
@@ -130,6 +130,7 @@ def make_runtime(store: StoreStub) -> SimpleNamespace:
             "drive_hits": 0, "drive_misses": 0, "wix_hits": 0, "wix_uploads": 0,
         },
         get_notion_store=lambda: store,
+        get_settings=lambda: store.fetch_settings(),
         get_wix_client=lambda: ClientStub(),
         get_ticket_policy_text=lambda: "",
     )
@@ -146,7 +147,6 @@ def patch_wix_side(monkeypatch, wix_event, config_row):
         "wix_event_to_config_row",
         lambda event, ticket_defs, tz_name=TZ: config_row,
     )
-    monkeypatch.setattr(notion_orchestrator.time, "sleep", lambda s: None)
 
 
 def test_sync_fetches_all_lifecycle_rows(monkeypatch):
@@ -343,7 +343,6 @@ def test_update_row_missing_from_wix_gets_error_note(monkeypatch):
         "index_events_by_id_and_key",
         lambda runtime, fieldsets=None: ({}, {}),
     )
-    monkeypatch.setattr(notion_orchestrator.time, "sleep", lambda s: None)
 
     assert notion_push_events(make_runtime(store)) is True
     assert len(store.sync_results) == 1
@@ -14,7 +14,7 @@ from typing import Any, Dict, List, Optional
 
 import pytest
 
-from event_sync import notion_orchestrator
+from event_sync import images, notion_orchestrator
 from event_sync.notion_orchestrator import (
     enrich_events,
     notion_push_events,
@@ -171,6 +171,7 @@ def make_runtime(store: StoreStub, client: Optional[ClientStub] = None) -> Simpl
             "drive_hits": 0, "drive_misses": 0, "wix_hits": 0, "wix_uploads": 0,
         },
         get_notion_store=lambda: store,
+        get_settings=lambda: store.fetch_settings(),
         get_wix_client=lambda: client or ClientStub(),
         get_ticket_policy_text=lambda: "",
         get_default_ticket_capacity=lambda: 24,
@@ -183,7 +184,6 @@ def patch_index(monkeypatch, by_id=None, by_key=None):
         "index_events_by_id_and_key",
         lambda runtime, fieldsets=None: (by_id or {}, by_key or {}),
     )
-    monkeypatch.setattr(notion_orchestrator.time, "sleep", lambda s: None)
 
 
 def patch_config_row(monkeypatch, config_row):
@@ -595,6 +595,76 @@ def test_push_dry_run_writes_nothing_across_all_branches(monkeypatch):
     assert client.deleted == []
 
 
+# ---------------------------------------------------------------------------
+# Push image prefetch
+# ---------------------------------------------------------------------------
+
+
+def prefetch_rows() -> List[Dict[str, Any]]:
+    return [
+        make_row("Ready", page_id="p1", image_url=" ready-aug "),
+        make_row("Update", page_id="p2", image_url="update-aug"),
+        make_row("Cancel", page_id="p3", image_url="cancel-aug"),
+        make_row("Delete", page_id="p4", image_url="delete-aug"),
+        make_row(
+            "Ready", page_id="p5", image_url="ready-sep",
+            start_date="2026-09-02", end_date="2026-09-02",
+        ),
+    ]
+
+
+def patch_push_rows(monkeypatch) -> List[str]:
+    handled: List[str] = []
+    patch_index(monkeypatch)
+    monkeypatch.setattr(
+        notion_orchestrator,
+        "_push_row",
+        lambda ctx, row, name: handled.append(row["page_id"]),
+    )
+    return handled
+
+
+def test_push_prefetches_only_ready_and_update_images_in_month(monkeypatch):
+    handled = patch_push_rows(monkeypatch)
+    prefetched: List[List[str]] = []
+    monkeypatch.setattr(
+        images, "prefetch_drive_images",
+        lambda urls, runtime: prefetched.append(list(urls)) or 0,
+    )
+    store = StoreStub(prefetch_rows())
+
+    assert notion_push_events(
+        make_runtime(store), month_filters=["August"]
+    ) is True
+    assert prefetched == [["ready-aug", "update-aug"]]
+    assert handled == ["p1", "p2", "p3", "p4"]
+
+
+def test_push_dry_run_never_prefetches_images(monkeypatch):
+    handled = patch_push_rows(monkeypatch)
+    monkeypatch.setattr(
+        images, "prefetch_drive_images",
+        lambda urls, runtime: pytest.fail("prefetch ran during dry run"),
+    )
+    store = StoreStub(prefetch_rows())
+
+    assert notion_push_events(make_runtime(store), dry_run=True) is True
+    assert handled == ["p1", "p2", "p3", "p4", "p5"]
+
+
+def test_push_prefetch_failure_does_not_abort_the_row_loop(monkeypatch):
+    handled = patch_push_rows(monkeypatch)
+
+    def broken_prefetch(urls, runtime):
+        raise RuntimeError("drive unreachable")
+
+    monkeypatch.setattr(images, "prefetch_drive_images", broken_prefetch)
+    store = StoreStub(prefetch_rows())
+
+    assert notion_push_events(make_runtime(store)) is True
+    assert handled == ["p1", "p2", "p3", "p4", "p5"]
+
+
 def test_sync_dry_run_writes_nothing(monkeypatch):
     # A stale Published row would normally be refreshed; on a dry run the
     # write is withheld (and the pull/enrich passes are skipped upstream).
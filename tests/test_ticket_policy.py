@@ -238,6 +238,47 @@ def test_runtime_reads_policy_from_settings_once():
     assert len(calls) == 1
 
 
+def test_runtime_accessors_share_one_settings_read():
+    calls = []
+
+    def fetch_settings():
+        calls.append(1)
+        return {"default_ticket_policy": POLICY, "default_capacity": "30"}
+
+    runtime = make_sync_runtime(SimpleNamespace(fetch_settings=fetch_settings))
+    assert runtime.get_ticket_policy_text() == POLICY
+    assert runtime.get_default_ticket_capacity() == 30
+    assert len(calls) == 1
+
+
+def test_push_defaults_enrich_and_ticket_accessors_share_one_settings_read():
+    calls = []
+
+    def fetch_settings():
+        calls.append(1)
+        return {"default_ticket_policy": POLICY, "default_capacity": "30"}
+
+    store = SimpleNamespace(
+        fetch_settings=fetch_settings,
+        fetch_classes=lambda: {},
+        fetch_event_rows=lambda statuses=None, include_missing_status=False: [
+            {"page_id": "p1", "status": "Idea", "start_date": "2026-01-10"}
+        ],
+    )
+    runtime = make_sync_runtime(store)
+    ctx = SimpleNamespace(runtime=runtime, store=store, _defaults_context=None)
+
+    # Ready-row default fill, enrich (row filtered out by month after the
+    # Settings read), then the ticket accessors used at creation time.
+    _, _, settings = notion_orchestrator._get_defaults_context(ctx)
+    assert notion_orchestrator.enrich_events(runtime, month_filters=["March"]) is True
+    assert runtime.get_ticket_policy_text() == POLICY
+    assert runtime.get_default_ticket_capacity() == 30
+
+    assert settings["default_capacity"] == "30"
+    assert len(calls) == 1
+
+
 def test_runtime_blank_setting_means_off():
     runtime = make_sync_runtime(SimpleNamespace(fetch_settings=lambda: {}))
     assert runtime.get_ticket_policy_text() == ""
@@ -419,6 +460,7 @@ def make_refresh_runtime(
             "drive_hits": 0, "drive_misses": 0, "wix_hits": 0, "wix_uploads": 0,
         },
         get_notion_store=lambda: store,
+        get_settings=lambda: store.fetch_settings(),
         get_wix_client=lambda: client,
         get_ticket_policy_text=lambda: policy,
     )
@@ -437,7 +479,6 @@ def patch_refresh(monkeypatch, config_row):
         "wix_event_to_config_row",
         lambda event, ticket_defs, tz_name=TZ: config_row,
     )
-    monkeypatch.setattr(notion_orchestrator.time, "sleep", lambda s: None)
 
 
 def test_published_refresh_writes_policy_status_column(monkeypatch):
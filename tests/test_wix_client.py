@@ -1,3 +1,4 @@
+import pytest
 import requests
 
 from event_sync import wix_client as wix_client_module
@@ -76,6 +77,14 @@ def test_iter_events_falls_back_to_offset(monkeypatch):
     assert calls[2]["query"]["paging"] == {"limit": 2, "offset": 4}
 
 
+def test_session_mounts_pooled_adapter_without_transport_retries():
+    client = make_client()
+    adapter = client._session.get_adapter("https://www.wixapis.com/events")
+    assert adapter._pool_maxsize == wix_client_module.POOL_MAXSIZE
+    # _request owns retries (POST-safety rules); urllib3 must not replay.
+    assert adapter.max_retries.total == 0
+
+
 def test_list_events_respects_limit(monkeypatch):
     client = make_client()
 
@@ -90,6 +99,26 @@ def test_list_events_respects_limit(monkeypatch):
     assert len(events) == 1
 
 
+def test_list_events_pages_large_limits_and_stops_when_filled(monkeypatch):
+    client = make_client()
+    calls = []
+
+    def fake_request(method, endpoint, **kwargs):
+        calls.append(kwargs["json"]["query"]["paging"])
+        start = len(calls) * 100
+        return DummyResponse({
+            "events": [{"id": str(i)} for i in range(start, start + 100)],
+            "pagingMetadata": {"nextCursor": f"c{len(calls)}"},
+        })
+
+    monkeypatch.setattr(client, "_request", fake_request)
+
+    events = client.list_events(limit=150)
+
+    assert len(events) == 150
+    assert [paging["limit"] for paging in calls] == [100, 100]
+
+
 def test_create_ticket_definition_never_sends_limit_per_checkout(monkeypatch):
     """limitPerCheckout is read-only in the Wix API — sending it is a no-op
     that only misleads readers into thinking the checkout limit is set. The
@@ -159,9 +188,10 @@ def test_update_ticket_definition_policy_text(monkeypatch):
 
 
 class FakeHttpResponse:
-    def __init__(self, status=200, payload=None):
+    def __init__(self, status=200, payload=None, headers=None):
         self.status_code = status
         self._payload = payload if payload is not None else {}
+        self.headers = headers or {}
         self.text = ""
 
     def json(self):
@@ -256,3 +286,158 @@ def test_persistent_502_on_get_raises_after_retries(monkeypatch):
     except requests.exceptions.HTTPError:
         pass
     assert len(client._session.calls) == 3
+
+
+def test_rate_limit_honors_retry_after_header(monkeypatch):
+    sleeps = []
+    client = make_client()
+    client._session = FakeSession(
+        [FakeHttpResponse(429, headers={"Retry-After": "3"}), FakeHttpResponse(200, {})]
+    )
+    monkeypatch.setattr(wix_client_module.time, "sleep", lambda s: sleeps.append(s))
+    client._request("POST", "/events/v3/events/query", json={})
+    assert sleeps == [3.0]
+
+
+# ---------------------------------------------------------------------------
+# Write pacing (token bucket)
+# ---------------------------------------------------------------------------
+
+
+def test_token_bucket_bursts_then_paces(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(wix_client_module.time, "monotonic", lambda: 100.0)
+    monkeypatch.setattr(wix_client_module.time, "sleep", lambda s: sleeps.append(s))
+    bucket = wix_client_module.TokenBucket(capacity=2, rate_per_second=2.0)
+
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    # Bucket is dry and the clock hasn't moved: wait one refill interval.
+    assert bucket.acquire() == 0.5
+    assert sleeps == [0.5]
+
+
+def test_only_writes_draw_from_the_pacing_bucket(monkeypatch):
+    client = make_transport_client([FakeHttpResponse(200, {})] * 3, monkeypatch)
+    acquired = []
+    monkeypatch.setattr(client._write_limiter, "acquire", lambda: acquired.append(1))
+
+    client._request("POST", "/events/v3/events/query", json={})
+    client._request("GET", "/events/v3/events/abc")
+    assert acquired == []
+
+    client._request("PATCH", "/events/v3/events/abc", json={})
+    assert acquired == [1]
+
+
+def test_import_file_from_url_waits_until_ready(monkeypatch):
+    client = make_client()
+    monkeypatch.setattr(wix_client_module.time, "sleep", lambda s: None)
+    calls = []
+    replies = [
+        {"file": {"id": "abc.jpg", "operationStatus": "PENDING"}},
+        {"file": {"id": "abc.jpg", "operationStatus": "PENDING"}},
+        {"file": {"id": "abc.jpg", "operationStatus": "READY", "media": {}}},
+    ]
+
+    def fake_request(method, endpoint, **kwargs):
+        calls.append((method, endpoint, kwargs.get("json")))
+        return DummyResponse(replies.pop(0))
+
+    monkeypatch.setattr(client, "_request", fake_request)
+
+    descriptor = client.import_file_from_url("https://example.com/a.jpg", "a.jpg")
+
+    assert descriptor["operationStatus"] == "READY"
+    assert calls == [
+        (
+            "POST",
+            "/site-media/v1/files/import",
+            {"url": "https://example.com/a.jpg", "mediaType": "IMAGE", "displayName": "a.jpg"},
+        ),
+        ("GET", "/site-media/v1/files/abc.jpg", None),
+        ("GET", "/site-media/v1/files/abc.jpg", None),
+    ]
+
+
+def test_import_file_from_url_raises_when_import_fails(monkeypatch):
+    client = make_client()
+    monkeypatch.setattr(wix_client_module.time, "sleep", lambda s: None)
+    replies = [
+        {"file": {"id": "abc.jpg", "operationStatus": "PENDING"}},
+        {"file": {"id": "abc.jpg", "operationStatus": "FAILED"}},
+    ]
+    monkeypatch.setattr(
+        client, "_request", lambda method, endpoint, **kw: DummyResponse(replies.pop(0))
+    )
+
+    with pytest.raises(wix_client_module.WixApiError):
+        client.import_file_from_url("https://example.com/a.jpg")
+
+
+def test_import_file_from_url_gives_up_while_still_pending(monkeypatch):
+    client = make_client()
+    now = [0.0]
+    monkeypatch.setattr(wix_client_module.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(
+        wix_client_module.time, "sleep", lambda s: now.__setitem__(0, now[0] + s)
+    )
+    monkeypatch.setattr(
+        client,
+        "_request",
+        lambda method, endpoint, **kw: DummyResponse(
+            {"file": {"id": "abc.jpg", "operationStatus": "PENDING"}}
+        ),
+    )
+
+    with pytest.raises(wix_client_module.WixApiError):
+        client.import_file_from_url("https://example.com/a.jpg")
+    # A stuck import only delays the row briefly before the fallback runs.
+    assert now[0] <= 5
+
+
+def test_api_calls_share_precomputed_headers_not_session_defaults():
+    client = WixClient(api_key="test", site_id="site", account_id="account")
+    # The signed upload PUT shares the session; it must not carry the key.
+    assert "Authorization" not in client._session.headers
+    seen = []
+
+    class RecordingSession:
+        def request(self, method, url, **kwargs):
+            seen.append(kwargs["headers"])
+            return FakeHttpResponse(200, {})
+
+    client._session = RecordingSession()
+    client._request("GET", "/a")
+    client._request("GET", "/b")
+
+    assert seen[0] is seen[1]
+    assert seen[0] == {
+        "Authorization": "test",
+        "wix-site-id": "site",
+        "Content-Type": "application/json",
+        "wix-account-id": "account",
+    }
+
+
+def test_get_event_by_title_stops_paging_at_first_match(monkeypatch):
+    client = make_client()
+    pages = [
+        {"events": [{"id": "a", "title": None}, {"id": "b", "title": "Pottery Night"}],
+         "pagingMetadata": {"nextCursor": "c2"}},
+        {"events": [{"id": "c", "title": "pottery night"}], "pagingMetadata": {}},
+    ]
+    calls = []
+
+    def fake_request(method, endpoint, **kwargs):
+        calls.append(kwargs["json"])
+        return DummyResponse(pages[len(calls) - 1])
+
+    monkeypatch.setattr(client, "_request", fake_request)
+
+    assert client.get_event_by_title("POTTERY")["id"] == "b"
+    assert len(calls) == 1
+
+    calls.clear()
+    assert [e["id"] for e in client.search_events_by_title("pottery")] == ["b", "c"]
+